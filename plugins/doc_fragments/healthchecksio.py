@@ -18,4 +18,12 @@ options:
       - C(HEALTHCHECKSIO_API_TOKEN), C(HEALTHCHECKSIO_API_KEY), C(HC_API_TOKEN), C(HC_API_KEY)
     type: str
     required: true
+  request_timeout:
+    description:
+      - Timeout in seconds for each API request.
+      - Requests failing with a timeout or a retryable HTTP status (429, 502, 503, 504) are retried up to 3 times with backoff.
+    type: int
+    required: false
+    default: 30
+    version_added: 1.4.0
 """
@@ -6,11 +6,80 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import asyncio
+import hashlib
 import json
+import os
+import re
+import threading
+import time
 from ansible.module_utils.urls import fetch_url
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import env_fallback
 from urllib.parse import urljoin
+from typing import List, Optional, Union
+
+try:
+    # 2-5x faster than the stdlib on list responses; fall back silently
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    from pydantic import BaseModel
+
+    HAS_PYDANTIC = True
+except ImportError:
+    HAS_PYDANTIC = False
+
+try:
+    import diskcache
+
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+_DISK_CACHE_DIR = os.path.expanduser("~/.cache/community.healthchecksio")
+
+# Fallback for ping URLs where the last path segment isn't the uuid
+# (e.g. a trailing slash)
+_PING_URL_RE = re.compile(r"/([0-9a-f-]{36})/?$")
+
+if HAS_PYDANTIC:
+
+    class ChecksParams(BaseModel):
+        # Typed mirror of the checks argument spec. Items in the batched
+        # checks list bypass Ansible's argspec validation, so this model
+        # (compiled once by pydantic) type-checks them up front instead
+        # of failing mid-batch with a half-applied list. Extra keys are
+        # rejected: a misspelled field would otherwise be dropped by the
+        # payload projection and never surface.
+        model_config = {"frozen": True, "extra": "forbid"}
+
+        state: str = "present"
+        name: str = ""
+        tags: Union[List[str], str] = []
+        desc: str = ""
+        timeout: Optional[int] = None
+        grace: int = 3600
+        schedule: Optional[str] = None
+        tz: Optional[str] = None
+        manual_resume: bool = False
+        methods: str = ""
+        channels: str = ""
+        unique: List[str] = []
+        uuid: str = ""
+        slug: str = ""
+
+else:
+    ChecksParams = None
 
 
 class Response(object):
@@ -19,21 +88,26 @@ class Response(object):
         if resp:
             self.body = resp.read()
         self.info = info
+        self._json = None
+        self._json_parsed = False
 
     @property
     def json(self):
+        if self._json_parsed:
+            return self._json
+        self._json_parsed = True
         if not self.body:
             if "body" in self.info:
                 try:
-                    json_body = json.loads(to_text(self.info["body"]))
-                    return json_body
-                except json.decoder.JSONDecodeError:
-                    return {}
-            return None
+                    self._json = _json_loads(self.info["body"])
+                except ValueError:
+                    self._json = {}
+            return self._json
         try:
-            return json.loads(to_text(self.body))
+            self._json = _json_loads(self.body)
         except ValueError:
-            return None
+            self._json = None
+        return self._json
 
     @property
     def status_code(self):
@@ -41,16 +115,121 @@ class Response(object):
 
 
 class HealthchecksioHelper:
+
+    # API tokens (per base url) already validated in this process, so that
+    # repeated helper constructions don't each pay an extra round-trip.
+    _validated_tokens = set()
+
+    # Checks list fetched in this process, keyed by (base url, token).
+    # Invalidated whenever a check is created, updated or deleted.
+    _checks_cache = {}
+    _checks_cache_lock = threading.RLock()
+
+    # (etag, checks) pairs kept across invalidations so a refetch can be
+    # revalidated with If-None-Match and answered from a 304 without
+    # downloading or re-parsing the body.
+    _checks_etags = {}
+
+    # Lazily opened diskcache.Cache persisting the checks list (and its
+    # ETag) across Ansible runs; None until opened, False if unavailable.
+    _disk_cache = None
+
+    # Transient failures worth retrying with backoff; fetch_url reports
+    # timeouts and connection errors as status -1.
+    RETRY_STATUS_CODES = frozenset([-1, 429, 502, 503, 504])
+    _MAX_RETRIES = 3
+    _BACKOFF_FACTOR = 0.5
+
     def __init__(self, module):
         self.module = module
         self.base_url = self._get_base_url(module)
         self.api_token = self._get_api_token(module)
-        self.timeout = module.params.get("timeout", 30)
+        # Note: "timeout" is the check period in the checks module, not an
+        # HTTP timeout; the request timeout has its own parameter.
+        self.timeout = module.params.get("request_timeout") or 30
+        # cache_ttl=0 is meaningful (always revalidate), only None defaults
+        cache_ttl = module.params.get("cache_ttl")
+        self.cache_ttl = 60 if cache_ttl is None else cache_ttl
         self.headers = {"X-Api-Key": self.api_token}
-
-        response = self.get("checks")
-        if response.status_code == 401:
-            self.module.fail_json(msg="Failed to login using API token")
+        self._probe_thread = None
+        self._probe_response = None
+        self._probe_lock = threading.Lock()
+
+        if (self.base_url, self.api_token) not in self._validated_tokens:
+            # Validate the token in the background so the TLS handshake
+            # overlaps with payload preparation; send() joins the probe
+            # before the first real request.
+            self._probe_thread = threading.Thread(target=self._probe, daemon=True)
+            self._probe_thread.start()
+
+    def _probe(self):
+        # The disk entry from a previous run can spare the probe GET:
+        # fresh within cache_ttl it is used as-is, expired it still lets
+        # the probe revalidate with If-None-Match (a 304 proves the token
+        # works without transferring the list again).
+        disk = self._get_disk_cache()
+        entry = disk.get(self._disk_cache_key()) if disk is not None else None
+        if entry is not None:
+            etag = entry.get("etag")
+            if time.time() - entry["ts"] < self.cache_ttl:
+                self._seed_checks(entry["checks"], etag)
+                return
+            if etag:
+                response = self._send("GET", "checks", headers={"If-None-Match": etag})
+                if response.status_code == 304:
+                    self._seed_checks(entry["checks"], etag)
+                    disk.set(
+                        self._disk_cache_key(),
+                        {
+                            "etag": etag,
+                            "checks": entry["checks"],
+                            "ts": time.time(),
+                        },
+                    )
+                    return
+                self._probe_response = response
+                return
+        self._probe_response = self._send("GET", "checks")
+
+    def _seed_checks(self, checks, etag):
+        key = (self.base_url, self.api_token)
+        with self._checks_cache_lock:
+            self._checks_cache.setdefault(key, checks)
+            if etag:
+                self._checks_etags[key] = (etag, checks)
+
+    def _ensure_validated(self):
+        with self._probe_lock:
+            thread = self._probe_thread
+            if thread is None:
+                return
+            thread.join()
+            self._probe_thread = None
+            response = self._probe_response
+            if response is None:
+                # The probe was answered from the disk cache
+                self._validated_tokens.add((self.base_url, self.api_token))
+                return
+            if response.status_code == 401:
+                self.module.fail_json(msg="Failed to login using API token")
+            self._validated_tokens.add((self.base_url, self.api_token))
+            if response.status_code == 200:
+                # The probe already downloaded the checks list; seed the
+                # cache so the first create doesn't refetch it.
+                json_data = response.json
+                if json_data and "checks" in json_data:
+                    etag = response.info.get("etag")
+                    self._seed_checks(json_data["checks"], etag)
+                    disk = self._get_disk_cache()
+                    if disk is not None:
+                        disk.set(
+                            self._disk_cache_key(),
+                            {
+                                "etag": etag,
+                                "checks": json_data["checks"],
+                                "ts": time.time(),
+                            },
+                        )
 
     def _get_api_token(self, module):
         return module.params.get("management_api_token")
@@ -63,7 +242,11 @@ class HealthchecksioHelper:
             path = path[1:]
         return "%s/%s" % (self.base_url, path)
 
-    def send(self, method, path, data=None):
+    def send(self, method, path, data=None, headers=None):
+        self._ensure_validated()
+        return self._send(method, path, data=data, headers=headers)
+
+    def _send(self, method, path, data=None, headers=None):
         url = self._url_builder(path)
         data = self.module.jsonify(data)
 
@@ -71,20 +254,105 @@ class HealthchecksioHelper:
             if data == "null":
                 data = None
 
-        resp, info = fetch_url(
-            self.module,
-            url,
-            data=data,
-            headers=self.headers,
-            method=method,
-            timeout=self.timeout,
-        )
+        if headers:
+            headers = dict(self.headers, **headers)
+        else:
+            headers = self.headers
+
+        for attempt in range(self._MAX_RETRIES + 1):
+            resp, info = fetch_url(
+                self.module,
+                url,
+                data=data,
+                headers=headers,
+                method=method,
+                timeout=self.timeout,
+            )
+            if info["status"] not in self.RETRY_STATUS_CODES:
+                break
+            if attempt < self._MAX_RETRIES:
+                time.sleep(self._BACKOFF_FACTOR * (2**attempt))
 
         return Response(resp, info)
 
     def get(self, path, data=None):
         return self.send("GET", path, data)
 
+    def get_checks(self):
+        # Join the probe first so its seeded list is visible to the lookup
+        self._ensure_validated()
+        key = (self.base_url, self.api_token)
+        with self._checks_cache_lock:
+            checks = self._checks_cache.get(key)
+            if checks is None:
+                checks = self._fetch_checks(key)
+                self._checks_cache[key] = checks
+        return checks
+
+    def _fetch_checks(self, key):
+        etag, stale = self._checks_etags.get(key, (None, None))
+
+        disk = self._get_disk_cache()
+        entry = disk.get(self._disk_cache_key()) if disk is not None else None
+        if entry is not None:
+            if time.time() - entry["ts"] < self.cache_ttl:
+                return entry["checks"]
+            if etag is None:
+                # Expired but still good for If-None-Match revalidation
+                etag, stale = entry.get("etag"), entry["checks"]
+
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.send("GET", "checks", headers=headers)
+        if response.status_code == 304 and stale is not None:
+            checks = stale
+        else:
+            checks = response.json["checks"]
+            etag = response.info.get("etag")
+            if etag:
+                self._checks_etags[key] = (etag, checks)
+
+        if disk is not None:
+            disk.set(
+                self._disk_cache_key(),
+                {"etag": etag, "checks": checks, "ts": time.time()},
+            )
+        return checks
+
+    def _disk_cache_key(self):
+        # Keyed like the in-memory caches: the same token against a
+        # self-hosted instance must not share entries with healthchecks.io
+        key = f"{self.base_url or ''}\n{self.api_token or ''}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def _get_disk_cache(self):
+        cls = HealthchecksioHelper
+        if cls._disk_cache is None:
+            if HAS_DISKCACHE:
+                try:
+                    cls._disk_cache = diskcache.Cache(_DISK_CACHE_DIR)
+                except Exception:
+                    cls._disk_cache = False
+            else:
+                cls._disk_cache = False
+        # An empty diskcache.Cache is falsy (len() == 0), so only the
+        # explicit unavailable marker may map to None
+        return None if cls._disk_cache is False else cls._disk_cache
+
+    def cached_checks(self):
+        # Returns the cached checks list without fetching, or None.
+        # "Without fetching" still joins the probe: its response may
+        # already hold the list.
+        self._ensure_validated()
+        with self._checks_cache_lock:
+            return self._checks_cache.get((self.base_url, self.api_token))
+
+    def invalidate_checks_cache(self):
+        with self._checks_cache_lock:
+            self._checks_cache.pop((self.base_url, self.api_token), None)
+            disk = self._get_disk_cache()
+            if disk is not None:
+                disk.pop(self._disk_cache_key(), None)
+
     def put(self, path, data=None):
         return self.send("PUT", path, data)
 
@@ -95,6 +363,7 @@ class HealthchecksioHelper:
         return self.send("DELETE", path, data)
 
     def head(self, path, data=None):
+        self._ensure_validated()
         resp, info = fetch_url(
             self.module,
             "{0}/{1}".format(self.base_url, path),
@@ -127,7 +396,10 @@ class HealthchecksioHelper:
                 type="str",
                 fallback=(
                     env_fallback,
-                    ["HEALTHCHECKSIO_API_MANAGEMENT_BASE_URL", "HC_API_MANAGEMENT_BASE_URL"],
+                    [
+                        "HEALTHCHECKSIO_API_MANAGEMENT_BASE_URL",
+                        "HC_API_MANAGEMENT_BASE_URL",
+                    ],
                 ),
                 required=False,
                 no_log=False,
@@ -153,18 +425,21 @@ class HealthchecksioHelper:
                 required=False,
                 no_log=True,
             ),
-
+            request_timeout=dict(type="int", required=False, default=30),
         )
+
+
 class HealthchecksioPingHelper(HealthchecksioHelper):
     def _get_api_token(self, module):
         # We can use the management API token instead of the ping token
-        if module.params.get('ping_api_token') != "":
+        if module.params.get("ping_api_token") != "":
             return module.params.get("ping_api_token")
         return module.params.get("management_api_token")
 
     def _get_base_url(self, module):
         return module.params.get("ping_api_base_url")
 
+
 class BadgesInfo(object):
     def __init__(self, module):
         self.module = module
@@ -311,31 +586,169 @@ class ChecksPingsInfo(object):
 
 
 class Checks(object):
+
+    # Parameters the create/update API accepts; everything else
+    # (uuid, state, api tokens, ...) stays out of the request body.
+    PAYLOAD_FIELDS = (
+        "name",
+        "tags",
+        "desc",
+        "timeout",
+        "grace",
+        "schedule",
+        "tz",
+        "manual_resume",
+        "methods",
+        "channels",
+        "unique",
+        "slug",
+    )
+
     def __init__(self, module):
         self.module = module
         self.rest = HealthchecksioHelper(module)
+        self._prepare_dispatch = {
+            "present": self._prepare_create,
+            "absent": self._prepare_delete,
+            "pause": self._prepare_pause,
+        }
 
     def get_uuid(self, json_data):
         ping_url = json_data.get("ping_url", None)
         if ping_url is not None:
-            uuid = ping_url.split("/")[-1]
+            uuid = ping_url.rsplit("/", 1)[-1]
             if len(uuid) > 0:
                 return uuid
-            else:
-                return "(unable to determine uuid)"
+            match = _PING_URL_RE.search(ping_url)
+            if match:
+                return match.group(1)
+            return "(unable to determine uuid)"
         else:
             return "(unable to determine uuid)"
 
+    def _exit(self, result):
+        if result.pop("failed", False):
+            self.module.fail_json(changed=False, **result)
+        self.module.exit_json(**result)
+
+    def _known_missing(self, uuid):
+        checks = self.rest.cached_checks()
+        if checks is None:
+            return False
+        return uuid not in (self.get_uuid(check) for check in checks)
+
+    def _merge_item(self, item, default_state):
+        params = dict(self.module.params)
+        params.pop("checks", None)
+        state = item.get("state", default_state)
+        params.update({k: v for k, v in item.items() if k != "state"})
+        return state, params
+
+    def _prepare_one(self, item, default_state):
+        # Returns either a finished result dict or a
+        # (method, endpoint, body, interpret) request tuple.
+        state, params = self._merge_item(item, default_state)
+        prepare = self._prepare_dispatch.get(state)
+        if prepare is None:
+            return {"failed": True, "msg": f"Unknown state {state}"}
+        return prepare(params)
+
+    def _execute(self, prepared):
+        if isinstance(prepared, dict):
+            return prepared
+        method, endpoint, body, interpret = prepared
+        response = self.rest.send(method, endpoint, data=body)
+        return interpret(response.status_code, response.json)
+
+    def run_one(self, item, default_state):
+        return self._execute(self._prepare_one(item, default_state))
+
+    def run_batch_async(self, items, default_state, concurrency):
+        # Fan the batch out over a single aiohttp session; returns the
+        # result dicts in item order, or None when aiohttp is missing.
+        if not HAS_AIOHTTP:
+            return None
+        # Join the token probe first so a bad token fails the module the
+        # same way as the sync path, not as N per-item 401s
+        self.rest._ensure_validated()
+        prepared = [self._prepare_one(item, default_state) for item in items]
+        results = [p if isinstance(p, dict) else None for p in prepared]
+        asyncio.run(self._run_prepared_async(prepared, results, concurrency))
+        return results
+
+    async def _run_prepared_async(self, prepared, results, concurrency):
+        base_url = self.rest.base_url.strip().rstrip("/")
+        timeout = aiohttp.ClientTimeout(total=self.rest.timeout)
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+
+        retry_statuses = HealthchecksioHelper.RETRY_STATUS_CODES
+        max_retries = HealthchecksioHelper._MAX_RETRIES
+        backoff_factor = HealthchecksioHelper._BACKOFF_FACTOR
+
+        def exc_msg(e):
+            # to_native(asyncio.TimeoutError()) is an empty string
+            detail = to_native(e)
+            return f"{type(e).__name__}: {detail}" if detail else type(e).__name__
+
+        async def do_one(index, method, endpoint, body, interpret):
+            try:
+                last_exc = None
+                status_code = None
+                json_data = None
+                for attempt in range(max_retries + 1):
+                    try:
+                        async with session.request(
+                            method, f"{base_url}/{endpoint}", json=body
+                        ) as resp:
+                            status_code = resp.status
+                            try:
+                                json_data = await resp.json(content_type=None)
+                            except ValueError:
+                                json_data = None
+                        last_exc = None
+                    except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                        # The sync path retries these as status -1
+                        last_exc = e
+                    if last_exc is None and status_code not in retry_statuses:
+                        break
+                    if attempt < max_retries:
+                        await asyncio.sleep(backoff_factor * (2**attempt))
+                if last_exc is not None:
+                    results[index] = {
+                        "failed": True,
+                        "retryable": True,
+                        "msg": exc_msg(last_exc),
+                    }
+                else:
+                    results[index] = interpret(status_code, json_data)
+            except Exception as e:
+                results[index] = {
+                    "failed": True,
+                    "retryable": False,
+                    "msg": exc_msg(e),
+                }
+
+        async with aiohttp.ClientSession(
+            connector=connector, headers=dict(self.rest.headers), timeout=timeout
+        ) as session:
+            await asyncio.gather(
+                *(
+                    do_one(index, *request)
+                    for index, request in enumerate(prepared)
+                    if not isinstance(request, dict)
+                )
+            )
+
     def create(self):
-        if self.module.check_mode:
-            self.module.exit_json(changed=False, data={})
+        self._exit(self.create_one(dict(self.module.params)))
 
-        endpoint = "checks/"
+    def create_one(self, params):
+        return self._execute(self._prepare_create(params))
 
-        request_params = dict(self.module.params)
+    def _prepare_create(self, params):
+        endpoint = "checks/"
 
-        # uuid is not used to create or update, pop it
-        del request_params["uuid"]
+        request_params = {k: params[k] for k in self.PAYLOAD_FIELDS}
 
         # if schedule and tz, create a Cron check
         if request_params.get("schedule") and request_params.get("tz"):
@@ -346,10 +759,12 @@ class Checks(object):
             del request_params["schedule"]
             del request_params["tz"]
 
-        tags = self.module.params.get("tags", [])
-        request_params["tags"] = " ".join(tags)
+        # batched items may pass tags as an already space-delimited string
+        tags = request_params["tags"]
+        if not isinstance(tags, str):
+            request_params["tags"] = " ".join(tags) if tags else ""
 
-        checks = self.rest.get("checks").json["checks"]
+        checks = self.rest.get_checks()
         unique = request_params["unique"]
         c = [
             check
@@ -358,10 +773,10 @@ class Checks(object):
         ]
 
         if len(c) > 1 and len(unique) != 0:
-            self.module.fail_json(
-                changed=False,
-                msg=f"Expected to find one check matching unique parameters, {len(c)} found",
-            )
+            return {
+                "failed": True,
+                "msg": f"Expected to find one check matching unique parameters, {len(c)} found",
+            }
 
         # Extract all available channels if "*" is given
         if request_params["channels"] == "*":
@@ -371,10 +786,8 @@ class Checks(object):
         else:
             channels = request_params["channels"]
 
-        # If all request parameters (except unique and api_key) match, exit without changes
-        skip_idempotency_params = ["unique", "management_api_key", "management_api_token",
-                                   "management_api_base_url", "ping_api_key", 
-                                   "ping_api_base_url", "ping_api_token", "channels"]
+        # If all request parameters (except unique and channels) match, exit without changes
+        skip_idempotency_params = ["unique", "channels"]
         if (
             len(c) == 1
             and all(
@@ -384,81 +797,101 @@ class Checks(object):
             )
             and sorted(c[0]["channels"].split(",")) == sorted(channels.split(","))
         ):
-            self.module.exit_json(changed=False, data=c[0], uuid=self.get_uuid(c[0]))
-
-        response = self.rest.post(endpoint, data=request_params)
-        json_data = response.json
-        status_code = response.status_code
-
-        if status_code == 200:
-            uuid = self.get_uuid(json_data)
-            self.module.exit_json(
-                changed=True,
-                msg="Existing check {0} found and updated".format(uuid),
-                data=json_data,
-                uuid=uuid,
-            )
-
-        elif status_code == 201:
-            uuid = self.get_uuid(json_data)
-            self.module.exit_json(
-                changed=True,
-                msg="New check {0} created".format(uuid),
-                data=json_data,
-                uuid=uuid,
-            )
-
-        else:
-            self.module.fail_json(
-                changed=False,
-                msg="Failed to create or update delete check [HTTP {0}: {1}]".format(
-                    status_code, json_data.get("error", "(empty error message)")
-                ),
-            )
-
-        self.module.exit_json(changed=True, data=json_data)
+            return {"changed": False, "data": c[0], "uuid": self.get_uuid(c[0])}
+
+        return ("POST", endpoint, request_params, self._interpret_create)
+
+    # Success statuses for the create/update POST mapped to their messages
+    _CREATE_MESSAGES = {
+        200: "Existing check {0} found and updated",
+        201: "New check {0} created",
+    }
+
+    def _interpret_create(self, status_code, json_data):
+        self.rest.invalidate_checks_cache()
+
+        msg_template = self._CREATE_MESSAGES.get(status_code)
+        if msg_template is None:
+            error = (json_data or {}).get("error", "(empty error message)")
+            return {
+                "failed": True,
+                "retryable": status_code in HealthchecksioHelper.RETRY_STATUS_CODES,
+                "msg": "Failed to create or update delete check "
+                f"[HTTP {status_code}: {error}]",
+            }
+
+        uuid = self.get_uuid(json_data)
+        return {
+            "changed": True,
+            "msg": msg_template.format(uuid),
+            "data": json_data,
+            "uuid": uuid,
+        }
 
     def delete(self):
-        if self.module.check_mode:
-            self.module.exit_json(changed=False, data={})
-
-        uuid = self.module.params.get("uuid")
-        endpoint = "checks/{0}".format(uuid)
-        response = self.rest.delete(endpoint)
-        status_code = response.status_code
+        self._exit(self.delete_one(self.module.params))
+
+    def delete_one(self, params):
+        return self._execute(self._prepare_delete(params))
+
+    def _prepare_delete(self, params):
+        uuid = params["uuid"]
+        if not uuid:
+            return {"failed": True, "msg": "uuid is required when state is absent"}
+
+        # A previously fetched checks list can answer "not found" locally
+        if self._known_missing(uuid):
+            return {"changed": False, "msg": f"Check {uuid} not found"}
+
+        def interpret(status_code, json_data):
+            if status_code == 200:
+                self.rest.invalidate_checks_cache()
+                return {
+                    "changed": True,
+                    "msg": f"Check {uuid} successfully deleted",
+                }
+            elif status_code == 404:
+                return {"changed": False, "msg": f"Check {uuid} not found"}
+            else:
+                return {
+                    "failed": True,
+                    "retryable": status_code in HealthchecksioHelper.RETRY_STATUS_CODES,
+                    "msg": f"Failed delete check {uuid} [HTTP {status_code}]",
+                }
 
-        if status_code == 200:
-            self.module.exit_json(
-                changed=True, msg="Check {0} successfully deleted".format(uuid)
-            )
-        elif status_code == 404:
-            self.module.exit_json(changed=False, msg="Check {0} not found".format(uuid))
-        else:
-            self.module.fail_json(
-                changed=False,
-                msg="Failed delete check {0} [HTTP {1}]".format(uuid, status_code),
-            )
+        return ("DELETE", f"checks/{uuid}", None, interpret)
 
     def pause(self):
-        if self.module.check_mode:
-            self.module.exit_json(changed=False, data={})
-
-        uuid = self.module.params.get("uuid")
-        endpoint = "checks/{0}/pause".format(uuid)
-        response = self.rest.post(endpoint)
-        status_code = response.status_code
+        self._exit(self.pause_one(self.module.params))
+
+    def pause_one(self, params):
+        return self._execute(self._prepare_pause(params))
+
+    def _prepare_pause(self, params):
+        uuid = params["uuid"]
+        if not uuid:
+            return {"failed": True, "msg": "uuid is required when state is pause"}
+
+        # A previously fetched checks list can answer "not found" locally
+        if self._known_missing(uuid):
+            return {"changed": False, "msg": f"Check {uuid} not found"}
+
+        def interpret(status_code, json_data):
+            if status_code == 200:
+                return {
+                    "changed": True,
+                    "msg": f"Check {uuid} successfully paused",
+                }
+            elif status_code == 404:
+                return {"changed": False, "msg": f"Check {uuid} not found"}
+            else:
+                return {
+                    "failed": True,
+                    "retryable": status_code in HealthchecksioHelper.RETRY_STATUS_CODES,
+                    "msg": f"Failed delete check {uuid} [HTTP {status_code}]",
+                }
 
-        if status_code == 200:
-            self.module.exit_json(
-                changed=True, msg="Check {0} successfully paused".format(uuid)
-            )
-        elif status_code == 404:
-            self.module.exit_json(changed=False, msg="Check {0} not found".format(uuid))
-        else:
-            self.module.fail_json(
-                changed=False,
-                msg="Failed delete check {0} [HTTP {1}]".format(uuid, status_code),
-            )
+        return ("POST", f"checks/{uuid}/pause", None, interpret)
 
 
 class Ping(object):
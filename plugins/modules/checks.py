@@ -112,6 +112,42 @@ options:
     type: str
     required: false
     default: ""
+  checks:
+    description:
+      - List of checks to operate on in a single module invocation.
+      - Each list item accepts the same parameters as the module and overrides the module-level values.
+      - Each list item may also set its own C(state), defaulting to the module-level C(state).
+      - Much faster than looping over the module for many checks, since module startup is paid only once.
+    type: list
+    elements: dict
+    required: false
+    version_added: 1.4.0
+  concurrency:
+    description:
+      - Maximum number of API requests to run in parallel when C(checks) is given.
+      - Set to C(1) to process the list serially.
+      - Has no effect without C(checks).
+    type: int
+    required: false
+    default: 10
+    version_added: 1.4.0
+  async_mode:
+    description:
+      - Fan the C(checks) list out over a single keep-alive connection using C(aiohttp).
+      - Requires the C(aiohttp) Python library on the target; falls back to the threaded path when it is not installed.
+      - Has no effect without C(checks).
+    type: bool
+    required: false
+    default: false
+    version_added: 1.4.0
+  cache_ttl:
+    description:
+      - How long, in seconds, a locally cached checks list may be reused across runs for idempotency decisions.
+      - The cache is only used when the C(diskcache) Python library is installed on the target; set to C(0) to always revalidate against the API.
+    type: int
+    required: false
+    default: 60
+    version_added: 1.4.0
 extends_documentation_fragment:
   - community.healthchecksio.healthchecksio.documentation
 """
@@ -135,6 +171,18 @@ EXAMPLES = r"""
     desc: "my hourly test check"
     schedule: "0 * * * *"
     tz: UTC
+
+- name: Create several checks in one invocation
+  community.healthchecksio.checks:
+    state: present
+    unique: ["name"]
+    checks:
+      - name: "test one"
+        tags: ["test"]
+        timeout: 60
+      - name: "test two"
+        tags: ["test"]
+        timeout: 120
 """
 
 RETURN = r"""
@@ -175,45 +223,101 @@ uuid:
 from ansible_collections.community.healthchecksio.plugins.module_utils.healthchecksio import (
     HealthchecksioHelper,
     Checks,
+    ChecksParams,
 )
 from ansible.module_utils.basic import AnsibleModule, env_fallback
+from ansible.module_utils._text import to_native
+from concurrent.futures import ThreadPoolExecutor
+
+# Built once at import; the spec is static, so there is no point
+# rebuilding it on every module invocation.
+_ARGUMENT_SPEC = HealthchecksioHelper.healthchecksio_argument_spec()
+_ARGUMENT_SPEC.update(
+    state=dict(type="str", choices=["present", "absent", "pause"], default="present"),
+    name=dict(type="str", required=False, default=""),
+    tags=dict(type="list", elements="str", required=False, default=[]),
+    desc=dict(type="str", required=False, default=""),
+    timeout=dict(type="int", required=False),
+    grace=dict(type="int", required=False, default=3600),
+    schedule=dict(type="str", required=False),
+    tz=dict(type="str", required=False),
+    manual_resume=dict(type="bool", required=False, default=False),
+    methods=dict(type="str", required=False, default=""),
+    channels=dict(type="str", required=False, default=""),
+    unique=dict(type="list", elements="str", required=False, default=[]),
+    uuid=dict(type="str", required=False, default=""),
+    slug=dict(type="str", required=False, default=""),
+    checks=dict(type="list", elements="dict", required=False, default=None),
+    concurrency=dict(type="int", required=False, default=10),
+    async_mode=dict(type="bool", required=False, default=False),
+    cache_ttl=dict(type="int", required=False, default=60),
+)
 
 
 def run(module):
-    state = module.params.pop("state")
+    state = module.params["state"]
+    items = module.params.get("checks")
+
+    # Exit before the helper is built (and its API login paid) in check mode
+    if module.check_mode:
+        module.exit_json(changed=False, data=[] if items is not None else {})
+
+    # Batched items bypass argspec validation; type-check them up front
+    # when pydantic is available rather than failing mid-batch.
+    if items is not None and ChecksParams is not None:
+        for index, item in enumerate(items):
+            try:
+                ChecksParams(**item)
+            except Exception as e:
+                module.fail_json(
+                    msg=f"Invalid parameters for checks[{index}]: {to_native(e)}"
+                )
+
     checks = Checks(module)
-    if state == "present":
-        checks.create()
-    elif state == "absent":
-        checks.delete()
-    elif state == "pause":
-        checks.pause()
+
+    if items is None:
+        {"present": checks.create, "absent": checks.delete, "pause": checks.pause}[
+            state
+        ]()
+        return
+
+    concurrency = min(module.params.get("concurrency"), len(items))
+    results = None
+    if module.params.get("async_mode"):
+        # Falls back to the threaded path when aiohttp isn't installed
+        results = checks.run_batch_async(items, state, concurrency)
+    if results is None:
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [
+                    executor.submit(checks.run_one, item, state) for item in items
+                ]
+                results = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append({"failed": True, "msg": to_native(e)})
+        else:
+            results = [checks.run_one(item, state) for item in items]
+
+    changed = False
+    failed = False
+    for result in results:
+        changed |= result.get("changed", False)
+        failed |= result.get("failed", False)
+
+    if failed:
+        module.fail_json(
+            changed=changed, msg="One or more check operations failed", data=results
+        )
+    module.exit_json(changed=changed, data=results)
 
 
 def main():
-    argument_spec = HealthchecksioHelper.healthchecksio_argument_spec()
-    argument_spec.update(
-        state=dict(
-            type="str", choices=["present", "absent", "pause"], default="present"
-        ),
-        name=dict(type="str", required=False, default=""),
-        tags=dict(type="list", elements="str", required=False, default=[]),
-        desc=dict(type="str", required=False, default=""),
-        timeout=dict(type="int", required=False),
-        grace=dict(type="int", required=False, default=3600),
-        schedule=dict(type="str", required=False),
-        tz=dict(type="str", required=False),
-        manual_resume=dict(type="bool", required=False, default=False),
-        methods=dict(type="str", required=False, default=""),
-        channels=dict(type="str", required=False, default=""),
-        unique=dict(type="list", elements="str", required=False, default=[]),
-        uuid=dict(type="str", required=False, default=""),
-        slug=dict(type="str", required=False, default=""),
-    )
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_if=[("state", "absent", ["uuid"]), ("state", "pause", ["uuid"])],
         required_together=[("schedule", "tz")],
         mutually_exclusive=[("timeout", "schedule"), ("timeout", "tz")],
     )